@@ -88,10 +88,15 @@ class Player:
         """Utility method to control print statements based on the game's verbosity."""
         if self.game and self.game.verbose:
             print(message)
+    def mark_changed(self, groups=(), numbers=(), leaving=()):
+        """Tell the game which river groups and hand tile numbers a play touched."""
+        if self.game:
+            self.game.mark_changed(self, groups, numbers, leaving)
     def draw_tiles(self, deck, count=1):
         drawn_tiles = deck.draw(count)
         self.print(f"{self.name} drew {len(drawn_tiles)} tiles.")
         self.hand.extend(drawn_tiles)
+        return drawn_tiles
 
     def find_sets(self, hand):
         """Find all sets in the player's hand that are valid according to the game rules."""
@@ -146,6 +151,17 @@ class Player:
         all_melds = sets + runs
         return all_melds
 
+    def melds_read_number(self, number):
+        """Whether tiles of this number leaving the hand can give find_melds a new meld (a set freed of a duplicate)."""
+        suits = [tile.suit for tile in self.hand if tile.number == number]
+        return len(suits) >= 3 and len(set(suits)) == len(suits)
+
+    def melds_read_drawn(self, tile, river):
+        """Whether a drawn tile gives find_melds a new meld, which has to be a set of its number or a run of its
+        suit."""
+        return any(tile in meld for meld in
+                   self.find_melds([t for t in self.hand if t.number == tile.number or t.suit == tile.suit]))
+
     def play_best_meld(self):
         """Find and play the best meld based on tile values, returns True if a meld was played, False otherwise."""
         melds = self.find_melds()
@@ -159,6 +175,7 @@ class Player:
         """Remove meld from hand, and add it to the river."""
         for tile in meld:
             self.hand.remove(tile)
+        self.mark_changed(numbers=[tile.number for tile in meld])
         self.print(f"{self.name} played: {meld}")  # Print each meld played
         game.update_river(meld)  # 更新 river 並打印當前狀態
 
@@ -197,6 +214,22 @@ class Player:
 
         return extendable_runs
 
+    def runs_match_reads_group(self, group, hand=None):
+        """Whether find_runs_match_in_hand_and_river finds a tile of the hand next to the head or tail of this group."""
+        if hand is None:
+            hand = self.hand
+        if len(group) < 3:
+            return False
+        head, tail = group[0], group[-1]
+        return any(tile.suit == head.suit and tile.number == head.number - 1
+                   or tile.suit == tail.suit and tile.number == tail.number + 1
+                   for tile in hand) and isinstance(group, list) and self.is_run(group)
+
+    def runs_read_drawn(self, tile, river):
+        """Whether a drawn tile can extend a run in the river."""
+        return any(run and (run[0].number - 1 == tile.number or run[-1].number + 1 == tile.number)
+                   and self.runs_match_reads_group(run, [tile]) for run in river)
+
     def is_run(self, tiles):
         if len(tiles) < 3:
             return False
@@ -209,12 +242,14 @@ class Player:
             if tile not in self.hand:
                 self.print(f"Attempted to play {tile} which is not in hand. Skipping.")
                 continue
+            self.mark_changed(leaving=[run])
             if position == 'head':
                 run.insert(0, tile)  # 插入到Run的头部
             elif position == 'tail':
                 run.append(tile)  # 添加到Run的尾部
             # print(f"Before removing, {self.name}'s hand: {[str(tile) for tile in self.hand]}")
             self.hand.remove(tile)  # 从手牌中移除该牌
+            self.mark_changed(groups=[run], numbers=[tile.number])
             # print(f"After removing, {self.name}'s hand: {[str(tile) for tile in self.hand]}")
             self.print(f"{self.name} extended a run at the {position} with {tile}. Updated run: {run}")
             # game.update_river(tile)  # 更新 river 並打印當前狀態
@@ -225,26 +260,43 @@ class Player:
         changes_made = False
         new_river = game_river[:]  # 创建river的副本进行操作，避免直接修改原始列表
         for run in new_river:
-            if len(run) >= 5 and self.is_run(run):
-                for i in range(2, len(run) - 2):  # 避开头尾两张
-                    middle_tile = run[i]
-                    if middle_tile in self.hand:
-                        # 切割并创建新的部分
-                        left_part = run[:i + 1]
-                        right_part = run[i:]
-                        game.river.remove(run)
-                        self.hand.remove(middle_tile)
-                        game.river.append(left_part)
-                        game.river.append(right_part)
-                        changes_made = True
-                        self.print(
-                            f"{self.name} inserted {middle_tile} and split the run into {left_part} and {right_part}.")
-                        break  # 处理完一个后即退出，防止重复操作
-                if changes_made:
-                    break  # 已经修改了river，无需进一步循环
+            i = self.split_index(run)
+            if i is not None:
+                middle_tile = run[i]
+                # 切割并创建新的部分
+                left_part = run[:i + 1]
+                right_part = run[i:]
+                self.mark_changed(leaving=[run])
+                game.river.remove(run)
+                self.hand.remove(middle_tile)
+                game.river.append(left_part)
+                game.river.append(right_part)
+                self.mark_changed(groups=[left_part, right_part], numbers=[middle_tile.number])
+                changes_made = True
+                self.print(
+                    f"{self.name} inserted {middle_tile} and split the run into {left_part} and {right_part}.")
+                break  # 已经修改了river，无需进一步循环
 
         return changes_made
 
+    def split_index(self, run, hand=None):
+        """Index of the first middle tile of a river run of 5 or more tiles that is also in the hand, or None."""
+        if hand is None:
+            hand = self.hand
+        if len(run) >= 5 and self.is_run(run):
+            for i in range(2, len(run) - 2):  # 避开头尾两张
+                if run[i] in hand:
+                    return i
+        return None
+
+    def split_reads_group(self, group, hand=None):
+        """Whether insert_and_split_runs can split this river group with a tile of the hand."""
+        return self.split_index(group, hand) is not None
+
+    def split_read_drawn(self, tile, river):
+        """Whether a drawn tile can split a run in the river."""
+        return any(tile in run and self.split_reads_group(run, [tile]) for run in river)
+
     ## find sets with in hands and river!!!
 
     def find_sets_match_in_hand_and_river(self, game_river):
@@ -260,6 +312,23 @@ class Player:
                         extendable_sets.append((tile, set_group))
         return extendable_sets
 
+    def sets_match_reads_group(self, group, hand=None):
+        """Whether find_sets_match_in_hand_and_river finds a tile of the hand with this group's number and a suit it is
+        missing."""
+        if hand is None:
+            hand = self.hand
+        if len(group) < 3:
+            return False
+        number = group[0].number
+        suits = {tile.suit for tile in group}
+        return any(tile.number == number and tile.suit not in suits
+                   for tile in hand) and isinstance(group, list) and self.is_set(group)
+
+    def sets_read_drawn(self, tile, river):
+        """Whether a drawn tile can join a set in the river."""
+        return any(set_group and set_group[0].number == tile.number and self.sets_match_reads_group(set_group, [tile])
+                   for set_group in river)
+
     def is_set(self, tiles):
         if len(tiles) < 3:
             return False
@@ -273,8 +342,10 @@ class Player:
             if tile not in self.hand:
                 self.print(f"Attempted to play {tile} which is not in hand. Skipping.")
                 continue
+            self.mark_changed(leaving=[set_group])
             set_group.append(tile)
             self.hand.remove(tile)
+            self.mark_changed(numbers=[tile.number])
             game.update_river(set_group)  # Assuming game has a method to update river
             self.print(f"{self.name} added {tile} to a set in the river. Updated set: {set_group}")
             played_any = True
@@ -304,14 +375,44 @@ class Player:
                 pairs.append((number, needed_suits))
         return pairs
 
+    def pairs_read_number(self, number):
+        """Whether tiles of this number leaving the hand can give find_and_modify_runs_or_sets a new pair."""
+        return len({tile.suit for tile in self.hand if tile.number == number}) == 2
+
+    def pairs_read_drawn(self, tile, river):
+        """Whether a drawn tile makes a pair of its number in hand that an end of a river group can complete."""
+        suits = {t.suit for t in self.hand if t.number == tile.number}
+        if len(suits) != 2:
+            return False
+        suits_needed = {'Clover', 'Heart', 'Spade', 'Diamond'} - suits
+        return any(self.pair_ends(group, tile.number, suits_needed) for group in river)
+
+    def pairs_read_group(self, group, hand=None):
+        """Whether the head or tail of this river group can complete a pair in hand, i.e. the hand holds exactly two
+        other suits of its number."""
+        if hand is None:
+            hand = self.hand
+        if len(group) < 4:
+            return False
+        for end in [group[0], group[-1]]:
+            suits = {tile.suit for tile in hand if tile.number == end.number}
+            if len(suits) == 2 and end.suit not in suits:
+                return True
+        return False
+
+    def pair_ends(self, run, number, suits_needed):
+        """Head and tail of a river group of 4 or more tiles that can complete a pair of this number into a set."""
+        if len(run) < 4:
+            return []
+        return [tile for tile in [run[0], run[-1]] if tile.number == number and tile.suit in suits_needed]
+
     def modify_runs_and_create_set(self, game, number, suits_needed):
         """修改river中的runs或sets，并尝试创建新的set"""
         for run in game.river[:]:
             if len(run) >= 4:
-                for tile in [run[0], run[-1]]:  # 只检查头尾
-                    if tile.number == number and tile.suit in suits_needed:
-                        if self.create_and_add_new_set(game, run, number, tile.suit):
-                            return True
+                for tile in self.pair_ends(run, number, suits_needed):  # 只检查头尾
+                    if self.create_and_add_new_set(game, run, number, tile.suit):
+                        return True
             elif len(run) > 7:
                 for tile in run[3:-3]:
                     if tile.number == number and tile.suit in suits_needed:
@@ -336,8 +437,10 @@ class Player:
                     self.print(f"Attempted to play {tile} which is not in hand. Skipping.")
                     continue
                 self.hand.remove(tile)  # 从手牌中移除使用的牌
+            self.mark_changed(numbers=[number])
             game.update_river(new_run)
             game.river.append(new_set)
+            self.mark_changed(groups=[new_set])
             self.print(f"{self.name} created new set {new_set} and updated run {new_run}")
             return True
         return False
@@ -353,8 +456,10 @@ class Player:
                 self.print(f"Attempted to play {tile} which is not in hand. Skipping.")
                 continue
             self.hand.remove(tile)
+        self.mark_changed(numbers=[tile_to_remove.number])
         game.update_river(left_part + right_part)
         game.river.append(new_set)
+        self.mark_changed(groups=[new_set])
         self.print(f"{self.name} split run and created new set {new_set} at {tile_to_remove}")
 
     def remove_from_set_and_add_new_set(self, game, set_group, number, suits_needed):
@@ -363,9 +468,11 @@ class Player:
                                                                            tile.suit in suits_needed]
         for tile in new_set:
             self.hand.remove(tile)
+        self.mark_changed(numbers=[number])
         new_group = [tile for tile in set_group if tile not in new_set]
         game.update_river(new_group)
         game.river.append(new_set)
+        self.mark_changed(groups=[new_set])
         self.print(f"{self.name} modified set and created new set {new_set} from {set_group}")
 
     # Find Single-Set
@@ -380,9 +487,11 @@ class Player:
                     # Before removing, ensure the tile is still in the hand
                     if tile in self.hand:
                         self.hand.remove(tile)
+                        self.mark_changed(numbers=[tile.number])
                     for t in potential_set[1:]:
                         self.remove_tile_from_river(game, t)
                     game.river.append(potential_set)
+                    self.mark_changed(groups=[potential_set])
                     self.print(f"{self.name} played a new set with tiles: {potential_set}")
                     played = True
         return played
@@ -420,10 +529,33 @@ class Player:
                             return True
         return False
 
+    def is_single_set_source(self, group):
+        """River groups read by find_single_set. find_matching_tiles only stops at exactly 3 tiles, so a group whose
+        head and tail both match can spoil a set, and a group changing or leaving the river can let one through."""
+        return len(group) > 4 or (len(group) == 4 and self.is_set(group))
+
+    def single_set_reads_group(self, group, hand=None):
+        """Whether find_matching_tiles can take a tile of this river group for a new set with a tile of the hand."""
+        if hand is None:
+            hand = self.hand
+        if not self.is_single_set_source(group):
+            return False
+        if len(group) == 4:
+            tiles = group
+        else:
+            tiles = [group[0], group[-1]] + (group[3:-3] if len(group) > 7 else [])
+        return any(tile.number == own.number and tile.suit != own.suit for tile in tiles for own in hand)
+
+    def single_set_read_drawn(self, tile, river):
+        """Whether find_matching_tiles can take a tile of a river group for a new set with a drawn tile."""
+        return any(len(group) >= 4 and self.single_set_reads_group(group, [tile]) for group in river)
+
     def remove_tile_from_river(self, game, tile):
         for group in game.river:
             if tile in group:
+                self.mark_changed(leaving=[group])
                 group.remove(tile)
+                self.mark_changed(groups=[group])
                 if not group:  # 如果组合为空，从river中完全移除
                     game.river.remove(group)
                 break
@@ -440,6 +572,7 @@ class Player:
         if len(right_part) >= 3:
             river.append(right_part)
 
+        self.mark_changed(groups=[left_part, right_part], leaving=[run])
         river.remove(run)  # 从river中移除原来的run
 
         # 从手牌中移除用于新set的tiles
@@ -447,8 +580,10 @@ class Player:
         for tile in new_set:
             if tile in self.hand:
                 self.hand.remove(tile)
+                self.mark_changed(numbers=[tile.number])
 
         river.append(new_set)  # 将新set加入到river
+        self.mark_changed(groups=[new_set])
         self.print(f"{self.name} split run at {tile_to_remove} and created new set {new_set}")
 
     def has_won(self):
@@ -485,10 +620,14 @@ class Player:
             # self.hand = original_hand  
 
 class Game:
-    def __init__(self, players, strategies=None, cold_start_enabled=True, verbose=False):
+    def __init__(self, players, strategies=None, cold_start_enabled=True, verbose=False, full_rescan=False):
         self.verbose = verbose  # 控制打印输出, put in the first!
         self.deck = Deck() # shuffle
         self.players = [Player(name, game=self) for name in players]
+        self.turn_finders = {player: self.turn_actions(player) for player in self.players}
+        self.dirty_finders = {}  # filled in by initialize_game, then by mark_changed and mark_drawn
+        self.changed_groups = {player: {} for player in self.players}  # id -> group, see mark_changed_groups
+        self.full_rescan = full_rescan  # re-run every finder on every pass, as a reference for the dirty finders
         self.strategies = strategies  # Store strategies if provided
         self.initialize_game()
         self.river = []  # 存放所有玩家打出的牌
@@ -497,6 +636,7 @@ class Game:
         self.tempt_river = []
         self.tempt_hand = []
         self.total_points = 0
+        self.turn_changed = False  # set by mark_changed while a finder runs
 
 
 
@@ -508,6 +648,7 @@ class Game:
     def initialize_game(self):
         for player in self.players:
             player.draw_tiles(self.deck, 14)
+            self.dirty_finders[player] = [True] * len(self.turn_finders[player])  # nothing has been tried yet
             player.reset_stats()
             self.print(f"{player.name}'s starting hand: {[str(tile) for tile in player.hand]}")
             # Print remaining number of cards in the deck after initial drawing:
@@ -556,63 +697,154 @@ class Game:
             if player.is_first_cold_start:
                 self.print(f"{player.name} is the first to pass the cold start.")
             if not player.has_met_cold_start:  # If still not met, draw tiles
-                player.draw_tiles(self.deck, 1)
+                self.mark_drawn(player, player.draw_tiles(self.deck, 1))
                 self.print(f"{player.name} drew 1 tile because no valid melds meet the cold start condition")
                 # self.print_river()
         else:
-            melds_played = 0
-            while True:
-                any_action_taken = False
-
-                melds = player.find_melds()
-                if melds:
-                    best_meld = max(melds, key=lambda m: sum(tile.number for tile in m))
-                    player.play_tiles(best_meld, self)
-                    melds_played += 1
-                    any_action_taken = True
+            if self.full_rescan:
+                melds_played = self.rescan_finders(player)
+            else:
+                melds_played = self.run_dirty_finders(player)
 
-                extendable_set = player.find_sets_match_in_hand_and_river(self.river)
-                if extendable_set:
-                    player.extendable_set_play_tiles(self, extendable_set)
-                    melds_played += 1
-                    any_action_taken = True
+            if melds_played == 0:
+                self.mark_drawn(player, player.draw_tiles(self.deck, 1))
+                # self.print_river()
 
-                extendable_run = player.find_runs_match_in_hand_and_river(self.river)
-                if extendable_run:
-                    player.extend_run_play_tiles(extendable_run, self.river)
-                    melds_played += 1
-                    any_action_taken = True
+        self.print(f"{player.name}'s turn ends.")  # Adjusted to dot notation
+        self.print(
+            f"{player.name}'s hand after the round: {[f'{tile.suit[0]}{tile.number}' for tile in player.hand]}")  # Adjusted to dot notation
 
-                insert_or_not = player.insert_and_split_runs(self.river, self)
-                if insert_or_not:
-                    melds_played += 1
-                    any_action_taken = True
+        return {player.name: 'win' for player in self.players}
 
-                pair_or_not = player.find_and_modify_runs_or_sets(self)
-                if pair_or_not:
+    def run_dirty_finders(self, player):
+        melds_played = 0
+        dirty = self.dirty_finders[player]
+        # A finder is only re-run once a draw or play has marked something it reads; a clean finder, even one
+        # left clean since the player's last turn, would play nothing.
+        self.mark_changed_groups(player)
+        while any(dirty):
+            any_action_taken = False
+            for index, (action, _, _, _, _) in enumerate(self.turn_finders[player]):
+                self.mark_changed_groups(player)
+                if not dirty[index]:
+                    continue
+                self.turn_changed = False
+                played = action()
+                dirty[index] = played or self.turn_changed
+                if played:
                     melds_played += 1
                     any_action_taken = True
 
-                single_set = player.find_single_set(self)
-                if single_set:
+            if not any_action_taken:
+                break
+        return melds_played
+
+    def rescan_finders(self, player):
+        melds_played = 0
+        while True:
+            any_action_taken = False
+            for action, _, _, _, _ in self.turn_finders[player]:
+                if action():
                     melds_played += 1
                     any_action_taken = True
 
-                if not any_action_taken:
-                    break
+            if not any_action_taken:
+                break
+        return melds_played
 
-            if melds_played == 0:
-                player.draw_tiles(self.deck, 1)
-                # self.print_river()
+    def turn_actions(self, player):
+        """
+        The finders tried in each pass of player_turn, in order, as
+        (action, reads_number, reads_group, reads_leaving, reads_drawn). action plays whatever the finder found and
+        returns True if it counts as a play. The others are the Player predicates telling whether tiles of that number
+        leaving the hand, that river group as it is after a change, that river group as it was before a change, or that
+        tile arriving in the hand can give the finder something new to play.
+        """
+        def play_melds():
+            melds = player.find_melds()
+            if melds:
+                best_meld = max(melds, key=lambda m: sum(tile.number for tile in m))
+                player.play_tiles(best_meld, self)
+                return True
+            return False
 
-        self.print(f"{player.name}'s turn ends.")  # Adjusted to dot notation
-        self.print(
-            f"{player.name}'s hand after the round: {[f'{tile.suit[0]}{tile.number}' for tile in player.hand]}")  # Adjusted to dot notation
+        def extend_sets():
+            extendable_set = player.find_sets_match_in_hand_and_river(self.river)
+            if extendable_set:
+                player.extendable_set_play_tiles(self, extendable_set)
+                return True
+            return False
 
-        return {player.name: 'win' for player in self.players}
+        def extend_runs():
+            extendable_run = player.find_runs_match_in_hand_and_river(self.river)
+            if extendable_run:
+                player.extend_run_play_tiles(extendable_run, self.river)
+                return True
+            return False
+
+        # Plays only take tiles out of the hand, which can only free up a set in hand or a new pair.
+        def never(_):
+            return False
+
+        return [
+            (play_melds, player.melds_read_number, never, never, player.melds_read_drawn),
+            (extend_sets, never, player.sets_match_reads_group, never, player.sets_read_drawn),
+            (extend_runs, never, player.runs_match_reads_group, never, player.runs_read_drawn),
+            (lambda: player.insert_and_split_runs(self.river, self), never, player.split_reads_group, never,
+             player.split_read_drawn),
+            (lambda: player.find_and_modify_runs_or_sets(self), player.pairs_read_number, player.pairs_read_group,
+             never, player.pairs_read_drawn),
+            (lambda: player.find_single_set(self), never, player.single_set_reads_group, player.single_set_reads_group,
+             player.single_set_read_drawn),
+        ]
+
+    def mark_changed(self, player, groups=(), numbers=(), leaving=()):
+        """
+        Mark as dirty the finders of every player that read any of these river groups, and those of the player who
+        played that read any of these numbers of tiles that left the hand. Plays pass a group in groups after it
+        changes or joins the river, and in leaving before it changes or leaves. A clean finder already found nothing
+        in a group as it was, so only finders that can gain from a group going away read leaving groups, right away;
+        groups are checked by mark_changed_groups before the finders next run.
+        """
+        self.turn_changed = True
+        if numbers:
+            dirty = self.dirty_finders[player]
+            for index, (_, reads_number, _, _, _) in enumerate(self.turn_finders[player]):
+                if not dirty[index] and any(map(reads_number, numbers)):
+                    dirty[index] = True
+        if leaving:
+            for other, finders in self.turn_finders.items():
+                dirty = self.dirty_finders[other]
+                for index, (_, _, _, reads_leaving, _) in enumerate(finders):
+                    if not dirty[index] and any(map(reads_leaving, leaving)):
+                        dirty[index] = True
+        for changed in self.changed_groups.values():
+            for group in groups:
+                changed[id(group)] = group
+
+    def mark_changed_groups(self, player):
+        """
+        Check the river groups changed since the player's finders last looked at them. The finders only see the river
+        as it is when they run, so a group changed several times is checked once, as it is now.
+        """
+        changed = self.changed_groups[player]
+        if changed:
+            dirty = self.dirty_finders[player]
+            for index, (_, _, reads_group, _, _) in enumerate(self.turn_finders[player]):
+                if not dirty[index] and any(map(reads_group, changed.values())):
+                    dirty[index] = True
+            changed.clear()
+
+    def mark_drawn(self, player, tiles):
+        """Mark as dirty the finders of the player that can play something new with these tiles just drawn."""
+        dirty = self.dirty_finders[player]
+        for index, (_, _, _, _, reads_drawn) in enumerate(self.turn_finders[player]):
+            if not dirty[index] and any(reads_drawn(tile, self.river) for tile in tiles):
+                dirty[index] = True
 
     def update_river(self, meld):
         self.river.append(meld)
+        self.mark_changed(None, groups=[meld])
         self.print(f"Updated River: {self.river}")
 
     def print_river(self):
@@ -653,6 +885,30 @@ def monte_carlo_simulation(num_games, players):
 
     return results, player_stats, cold_start_stats
 
+def compare_turn_loops(num_games, players, seed=0):
+    """
+    Play the same seeded games with the dirty finders and with a full rescan of every finder on every pass, and
+    check that both give the same winners and the same verbose transcripts.
+    >>> compare_turn_loops(20, ["Winni", "Peter", "Rachel", "Carol"])
+    True
+    >>> compare_turn_loops(20, ["Winni", "Peter"])
+    True
+    """
+    import contextlib
+    import io
+    import random
+    for game_index in range(num_games):
+        results = []
+        for full_rescan in (False, True):
+            random.seed(seed + game_index)
+            transcript = io.StringIO()
+            with contextlib.redirect_stdout(transcript):
+                winners = Game(players, verbose=True, full_rescan=full_rescan).play_round()
+            results.append((winners, transcript.getvalue()))
+        if results[0] != results[1]:
+            return False
+    return True
+
 def display_statistics(results, player_stats, first_cold_start_stats):
     print("Starting Rummikub Games.\n")
     print("-" * 65)
@@ -687,6 +943,224 @@ def display_statistics(results, player_stats, first_cold_start_stats):
     print(f"Average not_first_cold_start  {average_not_first_win_percent:6.2f}% {average_not_first_win:10.0f} {average_not_first_lost:10.0f}\n")
 
 
+# Suit indices follow Tile.determine_suit (Clover, Heart, Diamond, Spade); find_runs scans Clover, Heart, Spade, Diamond.
+RUN_SUIT_ORDER = [0, 1, 3, 2]
+
+
+def greedy_cold_start_points(counts):
+    """
+    Vectorized version of Player.simulate_cold_start: repeatedly play the highest-valued meld found by find_melds.
+    Ties are broken in the same order as find_melds (sets by number, then runs by suit and start).
+    :param counts: int array of shape (hands, 4, 13), copies of each tile (suit, number - 1) in every hand
+    :return: int array of shape (hands,), total points the greedy cold start would lay down
+    >>> import numpy as np
+    >>> counts = np.zeros((1, 4, 13), dtype=int)
+    >>> for suit, number in [(0, 4), (1, 4), (2, 4), (1, 3), (1, 5), (0, 2), (0, 3)]:
+    ...     counts[0, suit, number - 1] += 1
+    >>> greedy_cold_start_points(counts)  # C4 H4 D4 and H3 H4 H5 are both worth 12, the set goes first
+    array([12])
+    >>> optimal_cold_start_points(counts[0])  # H3 H4 H5 then C2 C3 C4
+    21
+    """
+    import numpy as np
+    counts = counts.astype(np.int8)
+    numbers = np.arange(1, 14, dtype=np.int8)
+    total = np.zeros(counts.shape[0], dtype=np.int64)
+    active = np.arange(counts.shape[0])  # hands that may still hold a meld
+    while active.size:
+        present = counts > 0
+        # Sets: one tile per suit, at least 3 suits; find_sets rejects a number whose group has duplicates.
+        suit_count = present.sum(axis=1, dtype=np.int8)
+        valid_set = (suit_count >= 3) & ~(counts > 1).any(axis=1)
+        set_values = np.where(valid_set, suit_count * numbers, 0).astype(np.int16)
+        # Runs: maximal stretches of consecutive numbers of one suit, at least 3 long.
+        run_len = present.astype(np.int8)
+        for n in range(11, -1, -1):
+            run_len[:, :, n] += present[:, :, n] * run_len[:, :, n + 1]
+        starts = present.copy()
+        starts[:, :, 1:] &= ~present[:, :, :-1]
+        run_len16 = run_len.astype(np.int16)
+        run_values = np.where(starts & (run_len >= 3), run_len16 * (2 * numbers + run_len16 - 1) // 2, 0)
+        values = np.concatenate([set_values, run_values[:, RUN_SUIT_ORDER, :].reshape(-1, 52)], axis=1)
+
+        best = values.argmax(axis=1)
+        best_values = values[np.arange(best.size), best]
+        keep = best_values > 0
+        counts, run_len, best, active = counts[keep], run_len[keep], best[keep], active[keep]
+        total[active] += best_values[keep]
+
+        rows = np.arange(best.size)
+        is_set = best < 13
+        counts[rows[is_set], :, best[is_set]] = 0
+        run_rows, run_index = rows[~is_set], best[~is_set] - 13
+        run_suits = np.array(RUN_SUIT_ORDER)[run_index // 13]
+        run_starts = run_index % 13
+        run_ends = run_starts + run_len[run_rows, run_suits, run_starts]
+        in_run = (numbers - 1 >= run_starts[:, None]) & (numbers - 1 < run_ends[:, None])
+        counts[run_rows, run_suits, :] -= in_run.astype(np.int8)
+    return total
+
+
+def meldable_tiles(counts):
+    """
+    Vectorized check of which tiles belong to at least one possible set (3 suits of the number) or run
+    (3 consecutive numbers of the suit). Tiles outside the mask can never be laid down, so dropping them
+    does not change optimal_cold_start_points.
+    :param counts: int array of shape (hands, 4, 13), copies of each tile (suit, number - 1) in every hand
+    :return: bool array of the same shape
+    """
+    import numpy as np
+    present = counts > 0
+    in_set = (present.sum(axis=1) >= 3)[:, None, :]
+    run_before = present.astype(np.int8)  # run length ending at each number
+    run_after = present.astype(np.int8)  # run length starting at each number
+    for n in range(1, 13):
+        run_before[:, :, n] += present[:, :, n] * run_before[:, :, n - 1]
+        run_after[:, :, 12 - n] += present[:, :, 12 - n] * run_after[:, :, 13 - n]
+    return present & (in_set | (run_before + run_after - 1 >= 3))
+
+
+def optimal_cold_start_points(counts, memo=None):
+    """
+    Best total points of disjoint sets and runs that can be laid down from one hand.
+    Tiles are decided in (number, suit) order, so the lowest remaining tile is either left in hand,
+    the lowest suit of a set, or the head of a run. This is a plain Python search, far slower than
+    greedy_cold_start_points.
+    :param counts: 4 x 13 nested sequence, copies of each tile (suit, number - 1) in the hand
+    :param memo: dict of already solved hands, can be shared between calls
+    :return: the maximum number of points
+    >>> import numpy as np
+    >>> counts = np.zeros((1, 4, 13), dtype=int)
+    >>> for suit, number in [(0, 11), (0, 12), (0, 13), (1, 13), (2, 13), (3, 13)]:
+    ...     counts[0, suit, number - 1] += 1
+    >>> greedy_cold_start_points(counts)  # the four 13s, leaving C11 C12
+    array([52])
+    >>> optimal_cold_start_points(counts[0])  # C11 C12 C13 and H13 D13 S13
+    75
+    """
+    if memo is None:
+        memo = {}
+
+    def best(state):
+        if state in memo:
+            return memo[state]
+        first = next((i for i, count in enumerate(state) if count), None)
+        if first is None:
+            return 0
+        number, suit = divmod(first, 4)
+        rest = list(state)
+        rest[first] -= 1
+        result = best(tuple(rest))
+        others = [number * 4 + s for s in range(suit + 1, 4) if state[number * 4 + s]]
+        for size in (2, 3):
+            for combo in itertools.combinations(others, size):
+                new_state = rest[:]
+                for i in combo:
+                    new_state[i] -= 1
+                result = max(result, (size + 1) * (number + 1) + best(tuple(new_state)))
+        new_state = rest[:]
+        value = number + 1
+        length = 1
+        for next_number in range(number + 1, 13):
+            if not state[next_number * 4 + suit]:
+                break
+            new_state[next_number * 4 + suit] -= 1
+            value += next_number + 1
+            length += 1
+            if length >= 3:
+                result = max(result, value + best(tuple(new_state)))
+        memo[state] = result
+        return result
+
+    return best(tuple(int(counts[s][n]) for n in range(13) for s in range(4)))
+
+
+def opening_turn_simulation(num_hands, players, max_draws=None, batch_size=20000, optimal=False, seed=None):
+    """
+    Deal hands only (no full games) and record on which turn each seat can first pass the cold start rule.
+    Seats are dealt 14 tiles in order like Game.initialize_game, and the k-th draw of each seat is taken from the
+    deck in seat order, which matches Game.play_round as long as nobody has passed the cold start yet.
+    :param num_hands: number of deals to sample
+    :param players: player names in seat order
+    :param max_draws: draws per seat to follow, defaults to as many as the deck allows
+    :param batch_size: number of deals shuffled at once
+    :param optimal: also score every hand with the optimal meld selection; this runs a pure Python search on the
+                    hands the greedy rule cannot open and whose meldable tiles reach 30 points, and is much slower
+    :param seed: seed for numpy's random generator
+    :return: {'greedy': {player: counts}} (plus 'optimal' if requested); counts[t - 1] is the number of deals that
+             opened on turn t, and the last entry counts deals that never opened within max_draws draws
+    """
+    import numpy as np
+    num_players = len(players)
+    dealt = 14 * num_players
+    if not players:
+        raise ValueError("At least one player is needed to deal opening hands")
+    if dealt > 104:
+        raise ValueError(f"{num_players} players need {dealt} tiles for their opening hands but the deck has 104")
+    if max_draws is None:
+        max_draws = (104 - dealt) // num_players
+    if max_draws < 0 or dealt + max_draws * num_players > 104:
+        raise ValueError("Not enough tiles in the deck for this many draws")
+    rules = ['greedy', 'optimal'] if optimal else ['greedy']
+    opening_stats = {rule: {player: np.zeros(max_draws + 2, dtype=np.int64) for player in players} for rule in rules}
+    never = max_draws + 2
+    tile_ids = np.tile(np.arange(52), 2)
+    rng = np.random.default_rng(seed)
+
+    for batch_start in range(0, num_hands, batch_size):
+        size = min(batch_size, num_hands - batch_start)
+        decks = rng.permuted(np.broadcast_to(tile_ids, (size, 104)), axis=1)
+        rows = np.arange(size)
+        for seat, player in enumerate(players):
+            hands = decks[:, 14 * seat:14 * (seat + 1)]
+            counts = np.bincount((rows[:, None] * 52 + hands).ravel(), minlength=size * 52).reshape(size, 4, 13)
+            flat_counts = counts.reshape(size, 52)
+            greedy_turn = np.full(size, never)
+            optimal_turn = np.full(size, never)
+            memo = {}  # hands share many sub-hands, and each turn only adds one tile
+            for turn in range(1, max_draws + 2):
+                if turn > 1:
+                    flat_counts[rows, decks[:, dealt + (turn - 2) * num_players + seat]] += 1
+                pending = np.flatnonzero(greedy_turn == never)
+                passed = pending[greedy_cold_start_points(counts[pending]) >= 30]
+                greedy_turn[passed] = turn
+                if optimal:
+                    # The optimal selection scores at least as much as the greedy one.
+                    optimal_turn[np.intersect1d(passed, np.flatnonzero(optimal_turn == never))] = turn
+                    candidates = np.flatnonzero((optimal_turn == never) & (greedy_turn == never))
+                    meldable = counts[candidates] * meldable_tiles(counts[candidates])
+                    bound = (meldable * np.arange(1, 14)).sum(axis=(1, 2))
+                    for i, hand in zip(candidates[bound >= 30], meldable[bound >= 30]):
+                        if optimal_cold_start_points(hand, memo) >= 30:
+                            optimal_turn[i] = turn
+            opening_stats['greedy'][player] += np.bincount(greedy_turn - 1, minlength=never)
+            if optimal:
+                opening_stats['optimal'][player] += np.bincount(optimal_turn - 1, minlength=never)
+
+    return opening_stats
+
+
+def display_opening_statistics(opening_stats):
+    for rule, player_turns in opening_stats.items():
+        print(f"\nCold Start Opening Turns ({rule})\n")
+        print("Name            Turn 1%  Mean turn  Unopened%")
+        print("-------------- -------- ---------- ----------")
+        for player, turns in player_turns.items():
+            num_hands = turns.sum()
+            opened = turns[:-1].sum()
+            mean_turn = (turns[:-1] * range(1, len(turns))).sum() / opened if opened > 0 else 0
+            first_percent = turns[0] / num_hands * 100 if num_hands > 0 else 0
+            unopened_percent = turns[-1] / num_hands * 100 if num_hands > 0 else 0
+            print(f"{player:15} {first_percent:7.2f}% {mean_turn:10.2f} {unopened_percent:9.2f}%")
+
+        print(f"\nOpened within k draws ({rule}), %\n")
+        print("Name          " + "".join(f"{k:7d}" for k in range(len(next(iter(player_turns.values()))) - 1)))
+        for player, turns in player_turns.items():
+            cumulative = turns[:-1].cumsum() / turns.sum() * 100 if turns.sum() > 0 else turns[:-1] * 0
+            print(f"{player:13} " + "".join(f"{percent:7.2f}" for percent in cumulative))
+        print()
+
+
 if __name__ == '__main__':
     number_games = 10000
     results, player_stats, first_cold_start_stats = monte_carlo_simulation(number_games, ["Winni", "Peter", "Rachel", "Carol"])